@@ -1,23 +1,28 @@
 from flask import Flask, render_template, request, jsonify, send_from_directory
 import os
-import re
+import sys
+import json
+import string
+import numpy as np
 import pandas as pd
 import speech_recognition as sr
-from PIL import Image
-
-# Fix for Pillow >=10.0 where ANTIALIAS is deprecated
-if hasattr(Image, 'Resampling'):
-    Image.ANTIALIAS = Image.Resampling.LANCZOS
-
-
-from moviepy.editor import VideoFileClip, concatenate_videoclips
 import subprocess
 import tempfile
-import uuid
+import secrets
 import time
 import requests
-
-app = Flask(__name__)
+from requests.adapters import HTTPAdapter
+import shutil
+import threading
+import functools
+import contextlib
+import socket
+import ssl
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# The built-in static route is disabled; serve_static below takes over the
+# 'static' endpoint (used by url_for in templates) to set cache headers
+app = Flask(__name__, static_folder=None)
 
 # Global paths
 DATASET_DIR = "NLP_dataset"
@@ -32,10 +37,236 @@ for directory in [DATASET_DIR, YT_DOWNLOADS_DIR, UPLOAD_FOLDER, TEMP_FOLDER, STA
     if not os.path.exists(directory):
         os.makedirs(directory)
 
-# Load CSV data once at startup for better performance
+# Lookup structures built from the CSV (see build_video_index)
+name_index = {}
+video_records = []
+
+def build_video_index(df):
+    """Precompute the cleaned-name index and per-row video info for fast lookups"""
+    global name_index, video_records
+
+    df['Name_clean'] = df['Name'].str.strip().str.lower()
+
+    # Keep the first row for duplicate names, matching the old scan order
+    index = {}
+    for idx, name in enumerate(df['Name_clean']):
+        index.setdefault(name, idx)
+
+    records = [
+        {
+            'link': row['Link'],
+            'yt_name': row['yt_name'],
+            'start_min': row['start_min'],
+            'start_sec': row['start_sec'],
+            'end_min': row['end_min'],
+            'end_sec': row['end_sec']
+        }
+        for row in df.to_dict('records')
+    ]
+
+    name_index, video_records = index, records
+
+# Guards the one-time CSV load, requests may race to trigger it
 videos_df = None
-if os.path.exists(CSV_PATH):
-    videos_df = pd.read_csv(CSV_PATH)
+videos_df_lock = threading.Lock()
+
+def load_videos_df():
+    """Load the CSV and build its lookup index once, safe to call from any request"""
+    global videos_df
+
+    if videos_df is None:
+        with videos_df_lock:
+            if videos_df is None and os.path.exists(CSV_PATH):
+                df = pd.read_csv(CSV_PATH)
+                build_video_index(df)
+                # Publish only after the index is ready
+                videos_df = df
+
+    return videos_df
+
+# Load CSV data once at startup for better performance
+load_videos_df()
+
+# Cache of word -> cut clip path, primed with clips already cut on disk
+clip_cache = {}
+for filename in os.listdir(DATASET_DIR):
+    if filename.endswith(".mp4"):
+        clip_cache[filename[:-len(".mp4")]] = os.path.join(DATASET_DIR, filename)
+
+# Sample rate recorded audio is decoded to before speech recognition
+SPEECH_SAMPLE_RATE = 16000
+
+# Local speech recognition model (int8-quantized Whisper)
+WHISPER_MODEL = "tiny.en"
+
+def initialize_asr_model():
+    try:
+        from faster_whisper import WhisperModel
+        return WhisperModel(WHISPER_MODEL, device="cpu", compute_type="int8")
+    except Exception as e:
+        print(f"Local speech model initialization failed: {str(e)}")
+        print("Will use Google speech recognition")
+        return None
+
+asr_model = initialize_asr_model()
+
+# Shared HTTP session so repeated downloads reuse pooled connections
+http_session = requests.Session()
+http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=3)
+http_session.mount('https://', http_adapter)
+http_session.mount('http://', http_adapter)
+
+class PunctuationTable(dict):
+    """str.translate table deleting what the regex [^\\w\\s] matches, filled in per character on first use"""
+
+    def __missing__(self, code_point):
+        char = chr(code_point)
+        # Same test as the regex: keep word characters and whitespace
+        result = code_point if char.isalnum() or char == '_' or char.isspace() else None
+        # Only remember the Basic Multilingual Plane, so arbitrary input
+        # cannot grow the table without bound
+        if code_point < 0x10000:
+            self[code_point] = result
+        return result
+
+# Punctuation and symbols stripped from input text (any script)
+PUNCTUATION_TABLE = PunctuationTable()
+
+# Words dropped from ISL sentences
+STOPWORDS = frozenset(['a', 'an', 'the', 'is', 'to', 'The', 'in', 'of', 'us', 'and', 'are', 'this', 'that', 'it'])
+
+# Canonical format every cut clip is normalized to, so clips can be
+# concatenated with stream copy
+CLIP_RESOLUTION = (640, 360)
+CLIP_FPS = 25
+CLIP_GOP = 12
+
+# Pre-rendered strip of all fingerspelling letters, plus each letter's
+# (start, end) seconds within it; built with: python app.py --build-alphabet
+# (strips built before B-frames were disabled leak frames between letters
+# and should be rebuilt)
+ALPHABET_STRIP_PATH = os.path.join(DATASET_DIR, "alphabet", "strip.mp4")
+ALPHABET_OFFSETS_PATH = os.path.join(DATASET_DIR, "alphabet", "offsets.json")
+
+alphabet_offsets = {}
+if os.path.exists(ALPHABET_STRIP_PATH) and os.path.exists(ALPHABET_OFFSETS_PATH):
+    with open(ALPHABET_OFFSETS_PATH) as f:
+        alphabet_offsets = {letter: tuple(offsets) for letter, offsets in json.load(f).items()}
+
+# How often a request checks whether its client has disconnected (seconds)
+CANCEL_POLL_INTERVAL = 0.1
+
+class RequestCancelled(Exception):
+    """Raised when work is abandoned because the client disconnected"""
+
+def run_command(command, cancel=None):
+    """Run a command like subprocess.run(check=True), terminating it if cancel is set"""
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    while True:
+        try:
+            returncode = process.wait(timeout=CANCEL_POLL_INTERVAL)
+            break
+        except subprocess.TimeoutExpired:
+            if cancel is not None and cancel.is_set():
+                process.terminate()
+                process.wait()
+                raise RequestCancelled(f"Cancelled: {command[0]}")
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command)
+
+@contextlib.contextmanager
+def cancel_on_disconnect():
+    """Yield an event that gets set if the current request's client disconnects"""
+    cancel = threading.Event()
+    done = threading.Event()
+
+    # Both gunicorn and the Werkzeug dev server expose the client socket
+    sock = request.environ.get('gunicorn.socket') or request.environ.get('werkzeug.socket')
+    peek_flags = socket.MSG_PEEK | getattr(socket, 'MSG_DONTWAIT', 0)
+
+    def watch():
+        while not done.wait(CANCEL_POLL_INTERVAL):
+            try:
+                # A closed connection reads as EOF; an open idle one would block
+                if sock.recv(1, peek_flags) == b'':
+                    cancel.set()
+                    return
+            except BlockingIOError:
+                continue
+            except OSError:
+                cancel.set()
+                return
+            except ValueError:
+                # The socket does not support recv flags; stop watching
+                return
+
+    # Non-blocking peeks need MSG_DONTWAIT, which Windows lacks, and TLS
+    # sockets (gunicorn with certfile) reject recv flags altogether
+    if sock is not None and hasattr(socket, 'MSG_DONTWAIT') and not isinstance(sock, ssl.SSLSocket):
+        threading.Thread(target=watch, daemon=True).start()
+
+    try:
+        yield cancel
+    finally:
+        done.set()
+
+# Number of words downloaded and cut in parallel, shared by all requests
+CLIP_WORKERS = 8
+clip_executor = ThreadPoolExecutor(max_workers=CLIP_WORKERS)
+
+# In-flight clip jobs by word, so concurrent requests share one job per word
+pending_clips = {}
+pending_clips_lock = threading.RLock()
+
+def submit_word_clip(word, word_info):
+    """Schedule process_word_clip on the shared pool, joining any in-flight job for the word"""
+    with pending_clips_lock:
+        future = pending_clips.get(word)
+        if future is None:
+            future = clip_executor.submit(process_word_clip, word, word_info)
+            pending_clips[word] = future
+            future.add_done_callback(lambda _, word=word: release_word_clip(word))
+        return future
+
+def release_word_clip(word):
+    """Forget a finished clip job; its result now lives in clip_cache"""
+    with pending_clips_lock:
+        pending_clips.pop(word, None)
+
+# Per-source-video locks so parallel words never download the same file twice
+download_locks = {}
+download_locks_guard = threading.Lock()
+
+def get_download_lock(yt_name):
+    """Return the lock serializing downloads of one source video"""
+    with download_locks_guard:
+        return download_locks.setdefault(yt_name, threading.Lock())
+
+def detect_video_codec():
+    """Pick the H.264 encoder, preferring NVENC hardware encoding when available"""
+    # Allow CPU-only deployments to force a specific encoder
+    override = os.environ.get("ISL_VIDEO_CODEC")
+    if override:
+        return override
+
+    # Encode one blank frame to confirm both the encoder build and a usable GPU
+    command = [
+        "ffmpeg", "-hide_banner",
+        "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+        "-frames:v", "1", "-c:v", "h264_nvenc",
+        "-f", "null", "-"
+    ]
+    try:
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return "h264_nvenc"
+    except Exception:
+        return "libx264"
+
+# Detect the encoder once at startup instead of per request
+VIDEO_CODEC = detect_video_codec()
+# NVENC quality settings (no zerolatency tuning, it lowers NVENC throughput)
+VIDEO_CODEC_PARAMS = ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "23"] if VIDEO_CODEC == "h264_nvenc" else []
 
 def download_and_convert_video(url, download_path, filename):
     """Download and convert video from a non-YouTube URL"""
@@ -83,19 +314,19 @@ def download_and_convert_video(url, download_path, filename):
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': '*/*',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': 'identity',  # Videos are already compressed
             'Connection': 'keep-alive',
             'Referer': 'https://talkinghands.co.in/'  # Add referrer for talkinghands.co.in
         }
         
         # Send a request to get the video content with headers
-        response = requests.get(url, stream=True, headers=headers, verify=False)  # Skip SSL verification
-        response.raise_for_status()  # Check for HTTP errors
-        
-        # Write the content to a file
-        with open(video_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        with http_session.get(url, stream=True, headers=headers, verify=False) as response:  # Skip SSL verification
+            response.raise_for_status()  # Check for HTTP errors
+            
+            # Stream the content to a file in large blocks
+            response.raw.decode_content = True
+            with open(video_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
         
         # Convert to MP4 if needed
         if file_extension.lower() != ".mp4":
@@ -161,34 +392,52 @@ def cut_video(word, yt_name, start_min, start_sec, end_min, end_sec):
     if not os.path.exists(in_path):
         return None
 
+    width, height = CLIP_RESOLUTION
+
+    # Letterbox rather than stretch so hand shapes keep their proportions
+    video_filter = (
+        f"scale={width}:{height}:flags=fast_bilinear:force_original_aspect_ratio=decrease,"
+        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={CLIP_FPS}"
+    )
+
+    # Cut and normalize in a single transcode; decoding from the seek point
+    # makes the cut frame-accurate, unlike a stream copy, which would start
+    # at the previous keyframe (often the previous letter's sign)
+    command = [
+        "ffmpeg", "-y",
+        "-ss", str(start), "-to", str(end),
+        "-i", in_path,
+        "-vf", video_filter,
+        "-c:v", VIDEO_CODEC, *VIDEO_CODEC_PARAMS,
+        "-g", str(CLIP_GOP),
+        "-pix_fmt", "yuv420p",
+        "-an"  # The combined video is silent, so don't keep audio
+    ]
+
+    # Build the clip in a temp dir and move it into place when finished, so
+    # other requests (or worker processes) never see a partial clip
     try:
-        clip = VideoFileClip(in_path).subclip(start, end)
-        clip.write_videofile(out_path, codec="libx264", audio_codec="aac")
-        return out_path
+        with tempfile.TemporaryDirectory(dir=TEMP_FOLDER) as tmp:
+            cut_path = os.path.join(tmp, "cut.mp4")
+            subprocess.run(command + [cut_path], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            shutil.move(cut_path, out_path)
     except Exception as e:
         print(f"Error cutting video for {word}: {str(e)}")
         return None
 
+    return out_path
+
 def text_to_isl(sentence):
     """Convert English text to ISL representation"""
     # Remove punctuation
-    pattern = r'[^\w\s]'
-    sentence = re.sub(pattern, '', sentence)
-    
-    # Define stopwords - extend the set from your existing implementation
-    stopwords_set = set(['a', 'an', 'the', 'is', 'to', 'The', 'in', 'of', 'us', 'and', 'are', 'this', 'that', 'it'])
+    sentence = sentence.translate(PUNCTUATION_TABLE)
     
     # Convert to lowercase and filter out stopwords, but preserve "I" as is
-    words = []
-    for word in sentence.split():
-        if word.lower() not in stopwords_set:
-            if word == "I":
-                words.append(word)  # Preserve uppercase I
-            else:
-                words.append(word.lower())
-    
-    # Join the words back into a sentence
-    isl_sentence = " ".join(words)
+    isl_sentence = " ".join(
+        word if word == "I" else word.lower()
+        for word in sentence.split()
+        if word.lower() not in STOPWORDS
+    )
     
     return isl_sentence
 
@@ -199,128 +448,138 @@ def recognize_speech_from_file(audio_file_path):
     try:
         with sr.AudioFile(audio_file_path) as source:
             audio_data = recognizer.record(source)
-            text = recognizer.recognize_google(audio_data)
-            return text
     except Exception as e:
         print(f"Speech recognition error: {str(e)}")
         return None
 
-def is_single_letter(word):
-    """Check if the word is a single letter (for special handling)"""
-    return len(word) == 1 and word.isalpha()
-
-def process_word_for_video(phrase, videos_df):
-    """Process a single word or phrase to find appropriate video clip"""
-    phrase_clean = phrase.strip().lower()
-
-    # Match against cleaned dataset entries
-    videos_df['Name_clean'] = videos_df['Name'].str.strip().str.lower()
-
-    matches = videos_df[videos_df['Name_clean'] == phrase_clean]
-    if not matches.empty:
-        idx = matches.index[0]
-        return get_video_info(idx, videos_df)
-
-    # Fallback: single letter check (only if it's one char)
-    if is_single_letter(phrase_clean):
-        matches = videos_df[videos_df['Name_clean'] == phrase_clean]
-        if not matches.empty:
-            idx = matches.index[0]
-            return get_video_info(idx, videos_df)
-
-    return None
-
+    return recognize_speech(audio_data)
 
+def recognize_speech(audio_data):
+    """Recognize speech from in-memory audio data"""
+    recognizer = sr.Recognizer()
 
-def get_video_info(idx, videos_df):
-    """Extract video information from dataframe row"""
-    return {
-        'link': videos_df['Link'].iloc[idx],
-        'yt_name': videos_df['yt_name'].iloc[idx],
-        'start_min': videos_df['start_min'].iloc[idx],
-        'start_sec': videos_df['start_sec'].iloc[idx],
-        'end_min': videos_df['end_min'].iloc[idx],
-        'end_sec': videos_df['end_sec'].iloc[idx]
-    }
+    try:
+        # Prefer the local model, no network round-trip
+        if asr_model is not None:
+            raw = audio_data.get_raw_data(convert_rate=SPEECH_SAMPLE_RATE, convert_width=2)
+            samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+            segments, _ = asr_model.transcribe(samples, beam_size=1)
+            text = " ".join(segment.text.strip() for segment in segments)
+            return text or None
+
+        text = recognizer.recognize_google(audio_data)
+        return text
+    except Exception as e:
+        print(f"Speech recognition error: {str(e)}")
+        return None
 
-def create_isl_video(isl_text, session_id):
+def decode_audio_to_pcm(audio_bytes):
+    """Decode any ffmpeg-readable audio to 16 kHz mono 16-bit PCM in memory"""
+    # Raw s16le output avoids WAV header handling on a non-seekable pipe
+    command = [
+        "ffmpeg",
+        "-i", "pipe:0",
+        "-f", "s16le", "-acodec", "pcm_s16le",
+        "-ac", "1", "-ar", str(SPEECH_SAMPLE_RATE),
+        "pipe:1"
+    ]
+    result = subprocess.run(command, input=audio_bytes, check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    return sr.AudioData(result.stdout, SPEECH_SAMPLE_RATE, 2)
+
+def create_isl_video(isl_text, session_id, cancel=None):
     """Create an ISL video from ISL text, supporting phrases and fallback"""
-    global videos_df
-
     # Load the CSV data if not already loaded
-    if videos_df is None and os.path.exists(CSV_PATH):
-        videos_df = pd.read_csv(CSV_PATH)
+    videos_df = load_videos_df()
 
     if videos_df is None:
         return None
 
     words = isl_text.split()
-    video_paths = []
+    # Dataset names are indexed lowercased, so lowercase the sentence once
+    words_lower = [word.lower() for word in words]
+    # (word, info) pairs in sentence order; clips are produced afterwards
+    resolved = []
 
     i = 0
     while i < len(words):
-        found = False
-
-        # Try to match 3-word phrases
-        if i + 2 < len(words):
-            phrase3 = " ".join(words[i:i+3])
-            info = process_word_for_video(phrase3, videos_df)
-            if info:
-                print(f"Found 3-word phrase: {phrase3}")
-                clip_path = process_word_clip(phrase3, info)
-                if clip_path:
-                    video_paths.append(clip_path)
-                i += 3
-                continue
-
-        # Try to match 2-word phrases
-        if i + 1 < len(words):
-            phrase2 = " ".join(words[i:i+2])
-            info = process_word_for_video(phrase2, videos_df)
-            if info:
-                print(f"Found 2-word phrase: {phrase2}")
-                clip_path = process_word_clip(phrase2, info)
-                if clip_path:
-                    video_paths.append(clip_path)
-                i += 2
+        # Greedily match the longest phrase (3, 2, then 1 words) starting here
+        for length in (3, 2, 1):
+            if i + length > len(words):
                 continue
-
-        # Fallback to single word
+            idx = name_index.get(" ".join(words_lower[i:i+length]))
+            if idx is not None:
+                break
+
+        if idx is not None:
+            phrase = " ".join(words[i:i+length])
+            print(f"Found {length}-word phrase: {phrase}")
+            resolved.append((phrase, video_records[idx]))
+            i += length
+            continue
+
+        # Fallback to fingerspelling
         word = words[i]
-        print(f"Processing word: {word}")
-        info = process_word_for_video(word, videos_df)
-        if info:
-            print(f"Found single word: {word}")
-            clip_path = process_word_clip(word, info)
-            if clip_path:
-                video_paths.append(clip_path)
-        else:
-            # Fallback to fingerspelling
-            print(f"Word '{word}' not found in dataset, spelling out...")
-            for letter in word.lower():
-                if not letter.isalpha():
-                    continue
-                letter_info = process_word_for_video(letter, videos_df)
-                if letter_info:
-                    clip_path = process_word_clip(letter, letter_info)
-                    if clip_path:
-                        video_paths.append(clip_path)
-                else:
-                    print(f"Letter '{letter}' not found in dataset")
+        print(f"Word '{word}' not found in dataset, spelling out...")
+        for letter in words_lower[i]:
+            if not letter.isalpha():
+                continue
+            # Take the letter straight from the alphabet strip when it exists
+            segment = letter_clip(letter)
+            if segment:
+                resolved.append((letter, segment))
+                continue
+            letter_idx = name_index.get(letter)
+            if letter_idx is not None:
+                resolved.append((letter, video_records[letter_idx]))
+            else:
+                print(f"Letter '{letter}' not found in dataset")
 
         i += 1
 
+    # Download and cut each distinct word once, in parallel; strip letters
+    # are already (path, start, end) segments and need no work
+    unique_words = {}
+    for word, info in resolved:
+        if isinstance(info, dict):
+            unique_words.setdefault(word, info)
+
+    futures = {word: submit_word_clip(word, info) for word, info in unique_words.items()}
+
+    # Stop waiting if the client goes away; the shared clip jobs keep running
+    # since their cached results serve later requests
+    pending = set(futures.values())
+    while pending:
+        if cancel is not None and cancel.is_set():
+            print("Client disconnected, abandoning ISL video")
+            return None
+        _, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL)
+
+    clip_by_word = {word: future.result() for word, future in futures.items()}
+
+    # Restore sentence order, repeating clips for repeated words
+    video_paths = []
+    for word, info in resolved:
+        clip = clip_by_word[word] if isinstance(info, dict) else info
+        if clip:
+            video_paths.append(clip)
+
     # Combine all video clips
     if video_paths:
-        return combine_videos(video_paths, session_id)
+        return combine_videos(video_paths, session_id, cancel)
 
     return None
 
 
 def process_word_clip(word, word_info):
     """Download and cut video for a specific word"""
-    # Download the YouTube video if needed
-    download_success = download_video(word_info['link'], YT_DOWNLOADS_DIR, word_info['yt_name'])
+    # Reuse a clip already cut in this process or found on disk at startup
+    if word in clip_cache:
+        return clip_cache[word]
+
+    # Download the YouTube video if needed; words sharing a source video
+    # (e.g. the fingerspelling letters) must not download it concurrently
+    with get_download_lock(word_info['yt_name']):
+        download_success = download_video(word_info['link'], YT_DOWNLOADS_DIR, word_info['yt_name'])
     
     if download_success:
         # Cut the relevant portion
@@ -332,42 +591,182 @@ def process_word_clip(word, word_info):
             word_info['end_min'],
             word_info['end_sec']
         )
+
+        # Only cache successful cuts so transient failures can be retried
+        if clip_path:
+            clip_cache[word] = clip_path
         
         return clip_path
     
     return None
 
-def combine_videos(video_paths, session_id):
+def concat_clips_copy(segments, output_file, cancel=None):
+    """Join clips with the ffmpeg concat demuxer, copying streams without re-encoding"""
+    with tempfile.TemporaryDirectory(dir=TEMP_FOLDER) as tmp:
+        list_path = os.path.join(tmp, "concat.txt")
+        with open(list_path, "w") as f:
+            for path, start, end in segments:
+                # Single quotes inside a concat list entry must be escaped
+                escaped = path.replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+                if start is not None:
+                    f.write(f"inpoint {start}\noutpoint {end}\n")
+
+        command = [
+            "ffmpeg", "-y",
+            "-f", "concat", "-safe", "0",
+            "-i", list_path,
+            "-c", "copy", "-an",
+            "-movflags", "+faststart",  # moov atom first so playback starts early
+            output_file
+        ]
+        run_command(command, cancel)
+
+def concat_clips_scaled(segments, resolution, output_file, extra_args=(), cancel=None):
+    """Join clips of differing sizes with the ffmpeg concat filter, scaling to one resolution"""
+    width, height = resolution
+
+    command = ["ffmpeg", "-y"]
+    for path, start, end in segments:
+        if start is not None:
+            command += ["-ss", str(start), "-to", str(end)]
+        command += ["-i", path]
+
+    filters = [
+        f"[{n}:v]scale={width}:{height},setsar=1,fps={CLIP_FPS},format=yuv420p[v{n}]"
+        for n in range(len(segments))
+    ]
+    inputs = "".join(f"[v{n}]" for n in range(len(segments)))
+    filters.append(f"{inputs}concat=n={len(segments)}:v=1:a=0[out]")
+
+    command += [
+        "-filter_complex", ";".join(filters),
+        "-map", "[out]",
+        "-c:v", VIDEO_CODEC, *VIDEO_CODEC_PARAMS,
+        *extra_args,
+        "-an",
+        "-movflags", "+faststart",  # moov atom first so playback starts early
+        output_file
+    ]
+    run_command(command, cancel)
+
+@functools.lru_cache(maxsize=4096)
+def probe_video_size(path):
+    """Read a clip's (width, height) with ffprobe, cached per path"""
+    command = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=width,height",
+        "-of", "csv=p=0",
+        path
+    ]
+    output = subprocess.check_output(command).decode().strip()
+    width, height = output.split(",")[:2]
+    return int(width), int(height)
+
+def probe_duration(path):
+    """Read a clip's duration in seconds with ffprobe"""
+    command = [
+        "ffprobe", "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "csv=p=0",
+        path
+    ]
+    return float(subprocess.check_output(command).decode().strip())
+
+def letter_clip(letter):
+    """Return the (path, start, end) range of a letter in the alphabet strip, if built"""
+    offsets = alphabet_offsets.get(letter)
+    if offsets is None:
+        return None
+
+    start, end = offsets
+    return (ALPHABET_STRIP_PATH, start, end)
+
+def build_alphabet_strip():
+    """Render every letter clip back-to-back into one strip and record each letter's range"""
+    global alphabet_offsets
+
+    load_videos_df()
+
+    letters = []
+    segments = []
+    for letter in string.ascii_lowercase:
+        idx = name_index.get(letter)
+        clip_path = process_word_clip(letter, video_records[idx]) if idx is not None else None
+        if clip_path:
+            letters.append(letter)
+            segments.append((clip_path, None, None))
+        else:
+            print(f"Letter '{letter}' not available, leaving it out of the alphabet strip")
+
+    if not segments:
+        return False
+
+    # Letter ranges in seconds, rounded to whole frames at the canonical rate
+    offsets = {}
+    position = 0
+    for letter, (path, _, _) in zip(letters, segments):
+        frames = round(probe_duration(path) * CLIP_FPS)
+        offsets[letter] = (position / CLIP_FPS, (position + frames) / CLIP_FPS)
+        position += frames
+
+    # A keyframe at every letter boundary lets stream-copy concat start exactly
+    # on a letter; without B-frames no packet of the next letter is decoded
+    # before a letter's outpoint, so it also ends exactly on the boundary
+    keyframes = ",".join(str(start) for start, _ in offsets.values())
+
+    os.makedirs(os.path.dirname(ALPHABET_STRIP_PATH), exist_ok=True)
+    try:
+        with tempfile.TemporaryDirectory(dir=TEMP_FOLDER) as tmp:
+            tmp_path = os.path.join(tmp, "strip.mp4")
+            concat_clips_scaled(
+                segments, CLIP_RESOLUTION, tmp_path,
+                extra_args=["-g", str(CLIP_GOP), "-bf", "0", "-force_key_frames", keyframes]
+            )
+            shutil.move(tmp_path, ALPHABET_STRIP_PATH)
+    except Exception as e:
+        print(f"Error building alphabet strip: {str(e)}")
+        return False
+
+    with open(ALPHABET_OFFSETS_PATH, "w") as f:
+        json.dump(offsets, f)
+
+    alphabet_offsets = offsets
+    print(f"Built alphabet strip with {len(offsets)} letters at {ALPHABET_STRIP_PATH}")
+    return True
+
+def combine_videos(video_paths, session_id, cancel=None):
     """Combine multiple video clips into one with uniform resolution"""
-    clips = []
-    base_resolution = None  # We'll use the first clip's resolution as reference
+    segments = []
+    sizes = []
 
-    for path in video_paths:
+    for item in video_paths:
+        # Entries are clip paths or (path, start, end) ranges of the alphabet strip
+        path, start, end = item if isinstance(item, tuple) else (item, None, None)
         if os.path.exists(path):
             try:
-                clip = VideoFileClip(path).without_audio()
-                
-                # Set base resolution from the first valid clip
-                if base_resolution is None:
-                    base_resolution = clip.size  # (width, height)
-
-                # Resize the clip if it doesn't match the base resolution
-                if clip.size != base_resolution:
-                    clip = clip.resize(newsize=base_resolution)
-
-                clips.append(clip)
+                sizes.append(probe_video_size(path))  # (width, height)
+                segments.append((os.path.abspath(path), start, end))
             except Exception as e:
-                print(f"Error loading or resizing clip {path}: {str(e)}")
+                print(f"Error loading clip {path}: {str(e)}")
 
-    if clips:
+    if segments:
         output_file = os.path.join(STATIC_VIDEOS, f"{session_id}.mp4")
+        # We'll use the first clip's resolution as reference
+        base_resolution = sizes[0]
         try:
-            final = concatenate_videoclips(clips, method="compose")
-            final.write_videofile(output_file, audio=False)
+            if all(size == base_resolution for size in sizes):
+                concat_clips_copy(segments, output_file, cancel)
+            else:
+                concat_clips_scaled(segments, base_resolution, output_file, cancel=cancel)
 
             return f"videos/{session_id}.mp4"
         except Exception as e:
             print(f"Error creating final video: {str(e)}")
+            # Don't leave a half-written video behind
+            if os.path.exists(output_file):
+                os.remove(output_file)
 
     return None
 
@@ -382,13 +781,14 @@ def process_text():
     english_text = data.get('text', '')
     
     # Generate a unique session ID
-    session_id = str(uuid.uuid4())
+    session_id = secrets.token_hex(16)
     
     # Convert English to ISL
     isl_text = text_to_isl(english_text)
     
-    # Create ISL video
-    video_path = create_isl_video(isl_text, session_id)
+    # Create ISL video, giving up early if the client disconnects
+    with cancel_on_disconnect() as cancel:
+        video_path = create_isl_video(isl_text, session_id, cancel)
     
     return jsonify({
         'status': 'success',
@@ -400,28 +800,26 @@ def process_text():
 @app.route('/process_audio', methods=['POST'])
 def process_audio():
     # Generate a unique session ID
-    session_id = str(uuid.uuid4())
+    session_id = secrets.token_hex(16)
     
     if 'audio' in request.files:
         audio_file = request.files['audio']
-        temp_path = os.path.join(TEMP_FOLDER, f"{session_id}.wav")
-        audio_file.save(temp_path)
         
-        # Recognize speech
-        english_text = recognize_speech_from_file(temp_path)
+        # The temp directory is removed even if recognition fails
+        with tempfile.TemporaryDirectory(dir=TEMP_FOLDER) as tmp:
+            temp_path = os.path.join(tmp, "input.wav")
+            audio_file.save(temp_path)
+            
+            # Recognize speech
+            english_text = recognize_speech_from_file(temp_path)
         
         if english_text:
             # Convert to ISL
             isl_text = text_to_isl(english_text)
             
-            # Create ISL video
-            video_path = create_isl_video(isl_text, session_id)
-            
-            # Clean up temp file
-            try:
-                os.remove(temp_path)
-            except:
-                pass
+            # Create ISL video, giving up early if the client disconnects
+            with cancel_on_disconnect() as cancel:
+                video_path = create_isl_video(isl_text, session_id, cancel)
             
             return jsonify({
                 'status': 'success',
@@ -438,18 +836,14 @@ def process_audio():
 @app.route('/record_audio', methods=['POST'])
 def record_audio():
     # Generate a unique session ID
-    session_id = str(uuid.uuid4())
+    session_id = secrets.token_hex(16)
     
     if 'audio' in request.files:
         audio_file = request.files['audio']
-        temp_path = os.path.join(TEMP_FOLDER, f"{session_id}.webm")
-        audio_file.save(temp_path)
         
-        # Convert webm to wav for speech recognition
-        wav_path = os.path.join(TEMP_FOLDER, f"{session_id}.wav")
-        command = ["ffmpeg", "-i", temp_path, wav_path]
+        # Decode webm straight to PCM in memory for speech recognition
         try:
-            subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            audio_data = decode_audio_to_pcm(audio_file.read())
         except:
             return jsonify({
                 'status': 'error',
@@ -457,21 +851,15 @@ def record_audio():
             })
             
         # Recognize speech
-        english_text = recognize_speech_from_file(wav_path)
+        english_text = recognize_speech(audio_data)
         
         if english_text:
             # Convert to ISL
             isl_text = text_to_isl(english_text)
             
-            # Create ISL video
-            video_path = create_isl_video(isl_text, session_id)
-            
-            # Clean up temp files
-            try:
-                os.remove(temp_path)
-                os.remove(wav_path)
-            except:
-                pass
+            # Create ISL video, giving up early if the client disconnects
+            with cancel_on_disconnect() as cancel:
+                video_path = create_isl_video(isl_text, session_id, cancel)
             
             return jsonify({
                 'status': 'success',
@@ -485,9 +873,24 @@ def record_audio():
         'message': 'Failed to process audio'
     })
 
-@app.route('/static/<path:filename>')
+@app.route('/static/<path:filename>', endpoint='static')
 def serve_static(filename):
-    return send_from_directory('static', filename)
+    # Generated ISL videos get a fresh random name and never change
+    if filename.startswith('videos/'):
+        response = send_from_directory('static', filename, conditional=True, max_age=31536000)
+        response.cache_control.immutable = True
+    else:
+        response = send_from_directory('static', filename, conditional=True)
+
+    # Let the browser seek with range requests instead of re-downloading
+    response.headers['Accept-Ranges'] = 'bytes'
+    return response
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    if "--build-alphabet" in sys.argv:
+        build_alphabet_strip()
+        sys.exit(0)
+
+    # Development server; in production run under gunicorn:
+    #   gunicorn -c gunicorn_conf.py app:app
+    app.run(debug=bool(os.getenv("FLASK_DEV")), threaded=True)
\ No newline at end of file
@@ -0,0 +1,17 @@
+# Gunicorn settings for serving app.py or main.py in production:
+#   gunicorn -c gunicorn_conf.py app:app
+#   gunicorn -c gunicorn_conf.py main:app
+# (equivalent to: gunicorn -b 127.0.0.1:5000 -k gthread -w 4 --threads 8 --timeout 300 main:app)
+
+# Local only, like the dev server; to expose it, pass e.g. -b 0.0.0.0:5000
+# (ideally behind a reverse proxy)
+bind = "127.0.0.1:5000"
+
+# Each worker handles several requests at once on threads, so ffmpeg,
+# yt-dlp and speech recognition waits overlap with other users' requests
+workers = 4
+threads = 8
+worker_class = "gthread"
+
+# Building a video for a long sentence can take minutes of download/ffmpeg work
+timeout = 300
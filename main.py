@@ -1,6 +1,8 @@
 from flask import Flask, render_template, request, jsonify, send_from_directory
 import os
+import sys
 import re
+import numpy as np
 import pandas as pd
 import speech_recognition as sr
 from moviepy.editor import VideoFileClip, concatenate_videoclips
@@ -9,11 +11,24 @@ import tempfile
 import uuid
 import time
 import requests
+from requests.adapters import HTTPAdapter
+import functools
+import json
+import io
+import av
+import wave
+import hashlib
+import shutil
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from rapidfuzz import fuzz, process
 from nltk.parse.stanford import StanfordParser
+from nltk.parse.corenlp import CoreNLPParser
 from nltk import ParentedTree, Tree
 import nltk
 from nltk.stem import WordNetLemmatizer
-from nltk.corpus import stopwords
+from nltk.corpus import stopwords, wordnet
 import os
 
 app = Flask(__name__)
@@ -31,25 +46,199 @@ for directory in [DATASET_DIR, YT_DOWNLOADS_DIR, UPLOAD_FOLDER, TEMP_FOLDER, STA
     if not os.path.exists(directory):
         os.makedirs(directory)
 
-# Load CSV data once at startup for better performance
+# Lookup structures built from the CSV (see build_video_index)
+name_index = {}
+yt_name_index = {}
+fuzzy_choices = {}
+
+# Per-row video information as parallel column arrays, indexed by row
+LINKS = np.empty(0, dtype=object)
+YT_NAMES = np.empty(0, dtype=object)
+START_MIN = np.empty(0, dtype=np.int32)
+START_SEC = np.empty(0, dtype=np.int32)
+END_MIN = np.empty(0, dtype=np.int32)
+END_SEC = np.empty(0, dtype=np.int32)
+
+VideoInfo = namedtuple('VideoInfo', ['link', 'yt_name', 'start_min', 'start_sec', 'end_min', 'end_sec'])
+
+# Minimum similarity (0-1) for a fuzzy word match, and the shortest word
+# that is fuzzy-matched at all; in shorter words one changed letter is
+# already a different word ("went" vs "want"), so they are fingerspelled
+FUZZY_MATCH_THRESHOLD = 0.75
+FUZZY_MIN_LENGTH = 5
+
+# Punctuation stripped from input text before ISL conversion
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Words dropped from ISL sentences
+STOPWORDS = frozenset(['a', 'an', 'the', 'is', 'to', 'The', 'in', 'of', 'us', 'and', 'are', 'this', 'that', 'it'])
+
+def build_video_index(df):
+    """Precompute name/yt_name indexes and per-row video columns for fast lookups"""
+    global name_index, yt_name_index, fuzzy_choices
+    global LINKS, YT_NAMES, START_MIN, START_SEC, END_MIN, END_SEC
+
+    # Keep the first row for duplicate keys, matching the old scan order
+    names = {}
+    for idx, name in enumerate(df['Name']):
+        names.setdefault(name.lower(), idx)
+
+    yt_names = {}
+    for idx, yt_name in enumerate(df['yt_name']):
+        yt_names.setdefault(yt_name, idx)
+
+    # Row index -> lowercased name for fuzzy matching, without single letters
+    choices = {idx: name.lower() for idx, name in enumerate(df['Name']) if len(name) > 1}
+
+    name_index, yt_name_index, fuzzy_choices = names, yt_names, choices
+
+    LINKS = df['Link'].to_numpy()
+    YT_NAMES = df['yt_name'].to_numpy()
+    START_MIN = df['start_min'].to_numpy(np.int32)
+    START_SEC = df['start_sec'].to_numpy(np.int32)
+    END_MIN = df['end_min'].to_numpy(np.int32)
+    END_SEC = df['end_sec'].to_numpy(np.int32)
+
+# Guards the one-time CSV load, requests may race to trigger it
 videos_df = None
-if os.path.exists(CSV_PATH):
-    videos_df = pd.read_csv(CSV_PATH)
+videos_df_lock = threading.Lock()
+
+def load_videos_df():
+    """Load the CSV and build its lookup index once, safe to call from any request"""
+    global videos_df
+
+    if videos_df is None:
+        with videos_df_lock:
+            if videos_df is None and os.path.exists(CSV_PATH):
+                df = pd.read_csv(CSV_PATH)
+                build_video_index(df)
+                # Publish only after the index is ready
+                videos_df = df
+
+    return videos_df
+
+# Load CSV data once at startup for better performance
+load_videos_df()
+
+# Cache of (yt_name, start, end) -> cut clip path for this process
+cut_clip_cache = {}
+
+# Local streaming speech recognition model (Vosk), optional
+VOSK_MODEL_PATH = os.environ.get("VOSK_MODEL_PATH", "models/vosk-small-en")
+VOSK_CHUNK_FRAMES = 4000
+
+# Sample rate recorded audio is decoded to before speech recognition
+SPEECH_SAMPLE_RATE = 16000
+
+def initialize_vosk_model():
+    try:
+        from vosk import Model
+        if not os.path.isdir(VOSK_MODEL_PATH):
+            raise FileNotFoundError(f"No Vosk model at {VOSK_MODEL_PATH}")
+        return Model(VOSK_MODEL_PATH)
+    except Exception as e:
+        print(f"Vosk initialization failed: {str(e)}")
+        print("Will use Google speech recognition")
+        return None
+
+# Optional higher-accuracy local model (faster-whisper, int8-quantized),
+# used instead of Vosk when set, e.g. WHISPER_MODEL=small.en
+WHISPER_MODEL = os.environ.get("WHISPER_MODEL")
+
+def initialize_whisper_model():
+    if not WHISPER_MODEL:
+        return None
+    try:
+        from faster_whisper import WhisperModel
+        return WhisperModel(WHISPER_MODEL, device="cpu", compute_type="int8")
+    except Exception as e:
+        print(f"Whisper initialization failed: {str(e)}")
+        return None
+
+# Maximum number of rendered sentence videos kept in STATIC_VIDEOS
+VIDEO_CACHE_SIZE = int(os.environ.get("ISL_VIDEO_CACHE_SIZE", "500"))
+
+# Number of words downloaded and cut in parallel per request
+CLIP_WORKERS = 8
+
+# Canonical format every cut clip is normalized to, so clips can be
+# concatenated with stream copy
+CLIP_RESOLUTION = (640, 360)
+CLIP_FPS = 25
+CLIP_GOP = 12
+
+# Per-source-video locks so parallel words never download the same file twice
+download_locks = {}
+download_locks_guard = threading.Lock()
+
+def get_download_lock(yt_name):
+    """Return the lock serializing downloads of one source video"""
+    with download_locks_guard:
+        return download_locks.setdefault(yt_name, threading.Lock())
+
+# Shared HTTP session so repeated downloads reuse pooled connections
+http_session = requests.Session()
+http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=3)
+http_session.mount('https://', http_adapter)
+http_session.mount('http://', http_adapter)
 
 # Initialize lemmatizer
 lemmatizer = WordNetLemmatizer()
 
+def wordnet_pos(tag):
+    """Map a Penn Treebank POS tag to the WordNet POS used for lemmatization"""
+    if tag.startswith('V'):
+        return 'v'
+    if tag.startswith('J'):
+        return 'a'
+    if tag.startswith('R'):
+        return 'r'
+    return 'n'
+
+@functools.lru_cache(maxsize=50000)
+def lemma(word, pos='n'):
+    """Lemmatize a word for a WordNet POS, cached so repeated tokens skip WordNet"""
+    return lemmatizer.lemmatize(word, pos=pos)
+
 # Download necessary NLTK data (add this to your app initialization)
 def download_nltk_data():
+    # Every worker runs this at startup, so skip the download (and its
+    # index fetch over the network) for data that is already installed
+    for package, resource in [('stopwords', 'corpora/stopwords'), ('wordnet', 'corpora/wordnet'), ('omw-1.4', 'corpora/omw-1.4')]:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            try:
+                nltk.download(package, quiet=True)
+            except:
+                print("NLTK data download failed, but continuing...")
+
+def warm_nltk_data():
+    """Load WordNet and the stopword list in this worker before any request needs them"""
+    # NLTK's lazy corpus loading is not thread-safe, so it must not first
+    # happen inside concurrent request threads
     try:
-        nltk.download('stopwords', quiet=True)
-        nltk.download('wordnet', quiet=True)
-        nltk.download('omw-1.4', quiet=True)
-    except:
-        print("NLTK data download failed, but continuing...")
+        wordnet.ensure_loaded()
+        stopwords.ensure_loaded()
+        lemma('running', 'v')
+    except Exception as e:
+        print(f"NLTK warm-up failed: {str(e)}")
+
+# Long-running CoreNLP server, started separately with e.g.
+#   java -mx2g -cp "stanford-corenlp/*" edu.stanford.nlp.pipeline.StanfordCoreNLPServer -port 9000
+CORENLP_URL = os.environ.get("CORENLP_URL", "http://localhost:9000")
 
 # Set up Stanford Parser (adjust paths as needed for your server)
 def initialize_stanford_parser():
+    # Prefer the CoreNLP server: parsing is then an HTTP call to a warm JVM
+    # instead of a fresh java process per sentence
+    try:
+        requests.get(CORENLP_URL, timeout=2).raise_for_status()
+        return CoreNLPParser(url=CORENLP_URL)
+    except Exception as e:
+        print(f"CoreNLP server not available at {CORENLP_URL}: {str(e)}")
+        print("Falling back to the Stanford Parser jar")
+
     java_path = "/usr/bin/java"  # Adjust based on your server's Java path
     os.environ['JAVAHOME'] = java_path
     
@@ -63,34 +252,61 @@ def initialize_stanford_parser():
         print(f"Stanford Parser initialization failed: {str(e)}")
         return None
 
-# Enhanced ISL conversion using Stanford Parser (if available)
+# Enhanced ISL conversion using Stanford Parser (if available); not called
+# by the request pipeline, which keeps English word order in parse_to_isl
 def convert_isl_advanced(parsetree):
-    dict = {}
     parenttree = ParentedTree.convert(parsetree)
-    for sub in parenttree.subtrees():
-        dict[sub.treeposition()] = 0
-    
+
+    # Flatten the tree once in pre-order, so every subtree is a contiguous
+    # index range nodes[i:end[i]] and parents are looked up by index
+    nodes = list(parenttree.subtrees())
+    node_index = {id(node): i for i, node in enumerate(nodes)}
+    parent = [node_index[id(node.parent())] if node.parent() is not None else None for node in nodes]
+    labels = [node.label() for node in nodes]
+
+    # Subtree sizes and leaf counts, accumulated bottom-up
+    size = [1] * len(nodes)
+    leaf_count = [0] * len(nodes)
+    for i in range(len(nodes) - 1, -1, -1):
+        leaf_count[i] += sum(1 for child in nodes[i] if not isinstance(child, Tree))
+        if parent[i] is not None:
+            size[parent[i]] += size[i]
+            leaf_count[parent[i]] += leaf_count[i]
+
+    used = [False] * len(nodes)
+
+    def is_free(i):
+        return not used[i] and (parent[i] is None or not used[parent[i]])
+
     isltree = Tree('ROOT', [])
     i = 0
-    for sub in parenttree.subtrees():
-        if sub.label() == "NP" and dict[sub.treeposition()] == 0 and dict[sub.parent().treeposition()] == 0:
-            dict[sub.treeposition()] = 1
-            isltree.insert(i, sub)
-            i = i + 1
-
-        if sub.label() == "VP" or sub.label() == "PRP":
-            for sub2 in sub.subtrees():
-                if (sub2.label() == "NP" or sub2.label() == 'PRP') and dict[sub2.treeposition()] == 0 and dict[sub2.parent().treeposition()] == 0:
-                    dict[sub2.treeposition()] = 1
-                    isltree.insert(i, sub2)
-                    i = i + 1
-
-    for sub in parenttree.subtrees():
-        for sub2 in sub.subtrees():
-            if len(sub2.leaves()) == 1 and dict[sub2.treeposition()] == 0 and dict[sub2.parent().treeposition()] == 0:
-                dict[sub2.treeposition()] = 1
-                isltree.insert(i, sub2)
-                i = i + 1
+
+    def take(j):
+        nonlocal i
+        used[j] = True
+        isltree.insert(i, nodes[j])
+        i = i + 1
+
+    # Noun phrases first, then NPs/pronouns inside verb phrases. Nodes are
+    # only ever marked as used, so re-scanning a range already covered by an
+    # enclosing VP/PRP scan cannot pick anything new and is skipped
+    covered = 0
+    for k in range(len(nodes)):
+        if k < covered:
+            continue
+        if labels[k] == "NP" and is_free(k):
+            take(k)
+
+        if labels[k] == "VP" or labels[k] == "PRP":
+            for j in range(k, k + size[k]):
+                if (labels[j] == "NP" or labels[j] == "PRP") and is_free(j):
+                    take(j)
+            covered = k + size[k]
+
+    # Remaining single-word subtrees in sentence order
+    for j in range(len(nodes)):
+        if leaf_count[j] == 1 and is_free(j):
+            take(j)
 
     return isltree
 
@@ -146,13 +362,13 @@ def download_and_convert_video(url, download_path, filename):
         }
         
         # Send a request to get the video content with headers
-        response = requests.get(url, stream=True, headers=headers, verify=False)  # Skip SSL verification
-        response.raise_for_status()  # Check for HTTP errors
-        
-        # Write the content to a file
-        with open(video_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        with http_session.get(url, stream=True, headers=headers, verify=False) as response:  # Skip SSL verification
+            response.raise_for_status()  # Check for HTTP errors
+            
+            # Stream the content to a file in large blocks
+            response.raw.decode_content = True
+            with open(video_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
         
         # Convert to MP4 if needed
         if file_extension.lower() != ".mp4":
@@ -218,45 +434,71 @@ def cut_video(word, yt_name, start_min, start_sec, end_min, end_sec):
     if not os.path.exists(in_path):
         return None
 
+    # Cut and normalize in a single transcode; decoding from the seek point
+    # makes the cut frame-accurate, unlike a stream copy, which would start
+    # at the previous keyframe (often the previous word's sign)
+    command = [
+        "ffmpeg", "-y",
+        "-ss", str(start), "-to", str(end),
+        "-i", in_path,
+        *canonical_video_args()
+    ]
+
+    # Build the clip in a temp dir and move it into place when finished, so
+    # other requests never see a partial clip
     try:
-        clip = VideoFileClip(in_path).subclip(start, end)
-        clip.write_videofile(out_path, codec="libx264", audio_codec="aac")
-        return out_path
+        with tempfile.TemporaryDirectory(dir=TEMP_FOLDER) as tmp:
+            cut_path = os.path.join(tmp, "cut.mp4")
+            subprocess.run(command + [cut_path], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            shutil.move(cut_path, out_path)
     except Exception as e:
         print(f"Error cutting video for {word}: {str(e)}")
         return None
 
+    return out_path
+
+def canonical_video_args():
+    """ffmpeg output options that encode to the canonical resolution, frame rate and GOP"""
+    width, height = CLIP_RESOLUTION
+
+    # Letterbox rather than stretch so hand shapes keep their proportions
+    video_filter = (
+        f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={CLIP_FPS}"
+    )
+    return [
+        "-vf", video_filter,
+        "-c:v", "libx264",
+        "-g", str(CLIP_GOP),
+        "-pix_fmt", "yuv420p",
+        "-an"
+    ]
+
+def normalize_clip(path):
+    """Re-encode a clip in place to the canonical format"""
+    command = ["ffmpeg", "-y", "-i", path, *canonical_video_args()]
+
+    try:
+        with tempfile.TemporaryDirectory(dir=TEMP_FOLDER) as tmp:
+            tmp_path = os.path.join(tmp, "normalized.mp4")
+            subprocess.run(command + [tmp_path], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            shutil.move(tmp_path, path)
+        return True
+    except Exception as e:
+        # The original clip is still usable, combine_videos will re-encode it
+        print(f"Error normalizing clip {path}: {str(e)}")
+        return False
+
 def text_to_isl_enhanced(sentence, sp=None):
     """Convert English text to ISL representation with linguistic analysis"""
     # Remove punctuation
-    pattern = r'[^\w\s]'
-    sentence = re.sub(pattern, '', sentence)
-    
-    # Define stopwords - extend the set from your existing implementation
-    stopwords_set = set(['a', 'an', 'the', 'is', 'to', 'The', 'in', 'of', 'us', 'and', 'are', 'this', 'that', 'it'])
+    sentence = PUNCTUATION_RE.sub('', sentence)
     
     # Try to use Stanford Parser if available
     try:
         if sp:
-            englishtree = [tree for tree in sp.parse(sentence.split())]
-            parsetree = englishtree[0]
-            
-            # Get original words from the parse tree
-            words = parsetree.leaves()
-            
-            # Apply lemmatization
-            lemmatized_words = [lemmatizer.lemmatize(w) for w in words]
-            
-            # Filter out stopwords and build ISL sentence
-            isl_sentence = ""
-            for w in lemmatized_words:
-                if w.lower() not in stopwords_set:
-                    if w == "I":  # Special case for "I"
-                        isl_sentence += w + " "
-                    else:
-                        isl_sentence += w.lower() + " "
-            
-            return isl_sentence.strip()
+            # Repeat sentences are served from the cache without parsing
+            return parse_to_isl(" ".join(sentence.split()), sp)
     except Exception as e:
         print(f"Advanced parsing failed: {str(e)}, falling back to basic method")
     
@@ -265,7 +507,7 @@ def text_to_isl_enhanced(sentence, sp=None):
     isl_words = []
     
     for word in words:
-        if word.lower() not in stopwords_set:
+        if word.lower() not in STOPWORDS:
             if word == "I":  # Preserve uppercase I
                 isl_words.append(word)
             else:
@@ -274,8 +516,76 @@ def text_to_isl_enhanced(sentence, sp=None):
     isl_sentence = " ".join(isl_words)
     return isl_sentence
 
+@functools.lru_cache(maxsize=4096)
+def parse_to_isl(sentence, sp):
+    """Parse a punctuation-stripped sentence and build its ISL form, cached per sentence"""
+    englishtree = [tree for tree in sp.parse(sentence.split())]
+    parsetree = englishtree[0]
+    
+    # Get original words with their POS tags from the parse tree, so verbs
+    # and adjectives are lemmatized as such rather than as nouns
+    tagged_words = parsetree.pos()
+    
+    # Filter out stopwords and build ISL sentence; stopwords are checked on
+    # the surface form too, since verb lemmas such as "is" -> "be" are not
+    # in the list themselves
+    isl_sentence = ""
+    for word, tag in tagged_words:
+        w = lemma(word, wordnet_pos(tag))
+        if word.lower() not in STOPWORDS and w.lower() not in STOPWORDS:
+            if w == "I":  # Special case for "I"
+                isl_sentence += w + " "
+            else:
+                isl_sentence += w.lower() + " "
+    
+    return isl_sentence.strip()
+
+def vosk_transcribe(chunks, sample_rate):
+    """Run the local Vosk model over mono 16-bit PCM chunks as they arrive"""
+    from vosk import KaldiRecognizer
+
+    recognizer = KaldiRecognizer(vosk_model, sample_rate)
+    texts = []
+
+    for data in chunks:
+        if recognizer.AcceptWaveform(data):
+            texts.append(json.loads(recognizer.Result())["text"])
+
+    texts.append(json.loads(recognizer.FinalResult())["text"])
+
+    text = " ".join(t for t in texts if t)
+    return text or None
+
+def recognize_speech_vosk(audio_file_path):
+    """Recognize speech from a mono 16-bit WAV file with the local Vosk model"""
+    with wave.open(audio_file_path, "rb") as wf:
+        if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+            raise ValueError("Vosk needs mono 16-bit PCM audio")
+
+        # Feed the audio in small chunks instead of loading it all at once
+        chunks = iter(lambda: wf.readframes(VOSK_CHUNK_FRAMES), b"")
+        return vosk_transcribe(chunks, wf.getframerate())
+
+def whisper_transcribe(audio):
+    """Transcribe an audio file path or float32 sample array with the local Whisper model"""
+    segments, _ = whisper_model.transcribe(audio, beam_size=1)
+    text = " ".join(segment.text.strip() for segment in segments)
+    return text or None
+
 def recognize_speech_from_file(audio_file_path):
     """Recognize speech from an audio file"""
+    # Prefer the local models, there is no network round-trip
+    if whisper_model is not None:
+        try:
+            return whisper_transcribe(audio_file_path)
+        except Exception as e:
+            print(f"Whisper recognition failed: {str(e)}, falling back to Google")
+    elif vosk_model is not None:
+        try:
+            return recognize_speech_vosk(audio_file_path)
+        except Exception as e:
+            print(f"Vosk recognition failed: {str(e)}, falling back to Google")
+
     recognizer = sr.Recognizer()
     
     try:
@@ -287,115 +597,158 @@ def recognize_speech_from_file(audio_file_path):
         print(f"Speech recognition error: {str(e)}")
         return None
 
+def recognize_speech(audio_data):
+    """Recognize speech from in-memory mono 16-bit audio data"""
+    if whisper_model is not None:
+        try:
+            raw = audio_data.get_raw_data(convert_rate=SPEECH_SAMPLE_RATE, convert_width=2)
+            samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+            return whisper_transcribe(samples)
+        except Exception as e:
+            print(f"Whisper recognition failed: {str(e)}, falling back to Google")
+    elif vosk_model is not None:
+        try:
+            raw = audio_data.get_raw_data()
+            chunk_size = VOSK_CHUNK_FRAMES * audio_data.sample_width
+            chunks = (raw[i:i + chunk_size] for i in range(0, len(raw), chunk_size))
+            return vosk_transcribe(chunks, audio_data.sample_rate)
+        except Exception as e:
+            print(f"Vosk recognition failed: {str(e)}, falling back to Google")
+
+    recognizer = sr.Recognizer()
+
+    try:
+        text = recognizer.recognize_google(audio_data)
+        return text
+    except Exception as e:
+        print(f"Speech recognition error: {str(e)}")
+        return None
+
+def decode_audio(audio_bytes):
+    """Decode compressed audio (e.g. browser webm/Opus) to 16 kHz mono PCM in memory"""
+    resampler = av.AudioResampler(format='s16', layout='mono', rate=SPEECH_SAMPLE_RATE)
+    pcm = bytearray()
+
+    with av.open(io.BytesIO(audio_bytes)) as container:
+        for frame in container.decode(audio=0):
+            for resampled in resampler.resample(frame):
+                pcm += resampled.to_ndarray().tobytes()
+
+    # Flush samples buffered inside the resampler
+    for resampled in resampler.resample(None):
+        pcm += resampled.to_ndarray().tobytes()
+
+    return sr.AudioData(bytes(pcm), SPEECH_SAMPLE_RATE, 2)
+
 def is_single_letter(word):
     """Check if the word is a single letter (for special handling)"""
     return len(word) == 1 and word.isalpha()
 
-def process_word_for_video_enhanced(word, videos_df):
+def process_word_for_video_enhanced(word):
     """Process a single word to find appropriate video clip with advanced matching"""
-     # Add these lines at the beginning of the function
-    
-    # Load the CSV data if not already loaded
-    if videos_df is None and os.path.exists(CSV_PATH):
-        videos_df = pd.read_csv(CSV_PATH)
+    if videos_df is None:
+        return None
     word_lower = word.lower()
     
     # Special case for "I" (pronoun)
-    if word == "I" and (videos_df['yt_name'] == "me").any():
-        idx = videos_df.index[videos_df['yt_name'] == "me"].tolist()[0]
-        return get_video_info(idx, videos_df)
+    if word == "I" and "me" in yt_name_index:
+        return get_video_info(yt_name_index["me"])
     
     # Direct match (case-insensitive)
-    if (videos_df['Name'].str.lower() == word_lower).any():
-        idx = videos_df.index[videos_df['Name'].str.lower() == word_lower].tolist()[0]
-        return get_video_info(idx, videos_df)
+    idx = name_index.get(word_lower)
+    if idx is not None:
+        return get_video_info(idx)
     
     # Try to find lemmatized version
-    lemma_word = lemmatizer.lemmatize(word_lower)
-    if lemma_word != word_lower and (videos_df['Name'].str.lower() == lemma_word).any():
-        idx = videos_df.index[videos_df['Name'].str.lower() == lemma_word].tolist()[0]
+    lemma_word = lemma(word_lower)
+    idx = name_index.get(lemma_word) if lemma_word != word_lower else None
+    if idx is not None:
         print(f"Found lemmatized match: {word} → {lemma_word}")
-        return get_video_info(idx, videos_df)
+        return get_video_info(idx)
     
-    # Check for similar words using basic string similarity
-    # This is a simple approach - you could use more advanced NLP techniques
-    best_match = None
-    best_score = 0
-    threshold = 0.75  # minimum similarity threshold
+    # Check for similar words over the whole vocabulary (single letters are
+    # excluded from fuzzy matching)
+    match = find_similar_name(word_lower, fuzzy_choices)
     
-    for idx, name in enumerate(videos_df['Name']):
-        # Skip single letters for similarity matching
-        if len(name) <= 1:
-            continue
-            
-        # Calculate similarity ratio (very basic)
-        name_lower = name.lower()
-        shorter = min(len(word_lower), len(name_lower))
-        longer = max(len(word_lower), len(name_lower))
-        
-        if shorter == 0:
-            continue
-            
-        # Count matching characters (case insensitive)
-        match_count = sum(1 for a, b in zip(word_lower, name_lower) if a == b)
-        score = match_count / longer
-        
-        if score > best_score and score >= threshold:
-            best_score = score
-            best_match = idx
-    
-    if best_match is not None:
-        matched_word = videos_df['Name'].iloc[best_match]
-        print(f"Found similar word: {word} → {matched_word} (score: {best_score:.2f})")
-        return get_video_info(best_match, videos_df)
-    
-    # If the word is a single letter, check for it
-    if is_single_letter(word) and (videos_df['Name'] == word.lower()).any():
-        idx = videos_df.index[videos_df['Name'] == word.lower()].tolist()[0]
-        return get_video_info(idx, videos_df)
+    if match is not None:
+        best_match, score = match
+        print(f"Found similar word: {word} → {fuzzy_choices[best_match]} (score: {score:.2f})")
+        return get_video_info(best_match)
     
     # Word not found
     return None
 
 
-def get_video_info(idx, videos_df):
-    """Extract video information from dataframe row"""
-    return {
-        'link': videos_df['Link'].iloc[idx],
-        'yt_name': videos_df['yt_name'].iloc[idx],
-        'start_min': videos_df['start_min'].iloc[idx],
-        'start_sec': videos_df['start_sec'].iloc[idx],
-        'end_min': videos_df['end_min'].iloc[idx],
-        'end_sec': videos_df['end_sec'].iloc[idx]
-    }
+def positional_similarity(word, name):
+    """Fraction of aligned positions where two words have the same character"""
+    matches = sum(1 for a, b in zip(word, name) if a == b)
+    return matches / max(len(word), len(name))
+
+def find_similar_name(word, choices):
+    """Return (index, score) of the closest vocabulary name to a word, or None
+
+    Edit-distance similarity only shortlists candidates; a match must also
+    line up character by character, so unrelated words that merely share
+    letters are fingerspelled instead of mapped to a wrong sign.
+
+    >>> choices = {0: 'twenty', 1: 'hand', 2: 'meeting', 3: 'where', 4: 'hello', 5: 'want', 6: 'here'}
+    >>> [find_similar_name(w, choices) for w in ['went', 'had', 'eating', 'were']]
+    [None, None, None, None]
+    >>> find_similar_name('hellp', choices)
+    (4, 0.8)
+    """
+    if len(word) < FUZZY_MIN_LENGTH:
+        return None
+
+    # Any name scoring >= the threshold positionally also scores at least as
+    # high on fuzz.ratio, so the prefilter never drops a valid match
+    candidates = process.extract(
+        word, choices,
+        scorer=fuzz.ratio,
+        score_cutoff=FUZZY_MATCH_THRESHOLD * 100,
+        limit=None
+    )
+
+    best = None
+    for _, _, idx in sorted(candidates, key=lambda candidate: candidate[2]):
+        score = positional_similarity(word, choices[idx])
+        if score >= FUZZY_MATCH_THRESHOLD and (best is None or score > best[1]):
+            best = (idx, score)
+
+    return best
+
+def get_video_info(idx):
+    """Return the video information for a dataframe row from the column arrays"""
+    return VideoInfo(
+        LINKS[idx],
+        YT_NAMES[idx],
+        int(START_MIN[idx]),
+        int(START_SEC[idx]),
+        int(END_MIN[idx]),
+        int(END_SEC[idx])
+    )
 
 def create_isl_video_enhanced(isl_text, session_id):
     """Create an ISL video from ISL text with enhanced word matching"""
-    global videos_df
-    
     # Load the CSV data if not already loaded
-    if videos_df is None and os.path.exists(CSV_PATH):
-        videos_df = pd.read_csv(CSV_PATH)
-    
-    if videos_df is None:
+    if load_videos_df() is None:
         return None
     
     words = isl_text.split()
-    video_paths = []
+    # (word, info) pairs in sentence order; clips are produced afterwards
+    resolved = []
     
     # Process each word
     for word in words:
         print(f"Processing word: {word}")
         
         # Try to find the word with enhanced matching
-        word_info = process_word_for_video_enhanced(word, videos_df)
+        word_info = process_word_for_video_enhanced(word)
         
         if word_info:
             # We found a match in the dataset
-            print(f"Found match for word: {word} → {word_info['yt_name']}")
-            clip_path = process_word_clip(word, word_info)
-            if clip_path:
-                video_paths.append(clip_path)
+            print(f"Found match for word: {word} → {word_info.yt_name}")
+            resolved.append((word, word_info))
         else:
             # Word not found - handle letter by letter (fingerspelling)
             print(f"Word '{word}' not found in dataset, spelling out...")
@@ -404,56 +757,176 @@ def create_isl_video_enhanced(isl_text, session_id):
                 if not letter.isalpha():
                     continue
                     
-                letter_info = process_word_for_video_enhanced(letter, videos_df)
+                letter_info = process_word_for_video_enhanced(letter)
                 if letter_info:
-                    clip_path = process_word_clip(letter, letter_info)
-                    if clip_path:
-                        video_paths.append(clip_path)
+                    resolved.append((letter, letter_info))
                 else:
                     print(f"Letter '{letter}' not found in dataset")
     
+    # Download and cut each distinct word once, in parallel
+    unique_words = {}
+    for word, info in resolved:
+        unique_words.setdefault(word, info)
+    
+    with ThreadPoolExecutor(max_workers=CLIP_WORKERS) as executor:
+        clip_paths = executor.map(lambda item: process_word_clip(*item), unique_words.items())
+        clip_by_word = dict(zip(unique_words, clip_paths))
+    
+    # Restore sentence order, repeating clips for repeated words
+    video_paths = [clip_by_word[word] for word, _ in resolved if clip_by_word[word]]
+    
+    # A failed download or cut leaves a word out; render that video under a
+    # one-off name so it is never cached as the sentence's video
+    if len(video_paths) < len(resolved):
+        session_id = str(uuid.uuid4())
+    
     # Combine all video clips
     if video_paths:
         return combine_videos(video_paths, session_id)
     
     return None
 
+def segment_key(word_info):
+    """Identify a dataset clip by its source video and cut range in seconds"""
+    start = word_info.start_min * 60 + word_info.start_sec
+    end = word_info.end_min * 60 + word_info.end_sec
+    return (word_info.yt_name, start, end)
+
 def process_word_clip(word, word_info):
     """Download and cut video for a specific word"""
-    # Download the YouTube video if needed
-    download_success = download_video(word_info['link'], YT_DOWNLOADS_DIR, word_info['yt_name'])
+    # Words matched to the same dataset row (directly, by lemma or fuzzily)
+    # reuse one cut clip instead of cutting it again under their own name
+    key = segment_key(word_info)
+    if key in cut_clip_cache:
+        return cut_clip_cache[key]
+
+    # Download the YouTube video if needed; words sharing a source video
+    # (e.g. the fingerspelling letters) must not download it concurrently
+    with get_download_lock(word_info.yt_name):
+        download_success = download_video(word_info.link, YT_DOWNLOADS_DIR, word_info.yt_name)
     
     if download_success:
         # Cut the relevant portion
         clip_path = cut_video(
             word,
-            word_info['yt_name'],
-            word_info['start_min'],
-            word_info['start_sec'],
-            word_info['end_min'],
-            word_info['end_sec']
+            word_info.yt_name,
+            word_info.start_min,
+            word_info.start_sec,
+            word_info.end_min,
+            word_info.end_sec
         )
+
+        # Only cache successful cuts so transient failures can be retried
+        if clip_path:
+            cut_clip_cache[key] = clip_path
         
         return clip_path
     
     return None
 
+def prime_cut_clip_cache():
+    """Register clips already cut into DATASET_DIR, so no worker cuts them again"""
+    for name, idx in name_index.items():
+        path = os.path.join(DATASET_DIR, f"{name}.mp4")
+        if os.path.exists(path):
+            cut_clip_cache.setdefault(segment_key(get_video_info(idx)), path)
+
+def prepare_dataset_clip(name, idx):
+    """Download, cut and normalize the clip for one vocabulary entry if it is missing"""
+    path = os.path.join(DATASET_DIR, f"{name}.mp4")
+    if os.path.exists(path):
+        # Clips cut before normalization was added are converted in place
+        try:
+            if probe_video_format(path)[1:] != CLIP_RESOLUTION:
+                normalize_clip(path)
+                probe_video_format.cache_clear()
+        except Exception as e:
+            print(f"Error checking clip {path}: {str(e)}")
+        return path
+
+    return process_word_clip(name, get_video_info(idx))
+
+def warmup():
+    """Pre-cut every vocabulary entry in the CSV so requests only concatenate clips"""
+    if load_videos_df() is None:
+        return
+
+    with ThreadPoolExecutor(max_workers=CLIP_WORKERS) as executor:
+        results = list(executor.map(lambda item: prepare_dataset_clip(*item), name_index.items()))
+
+    missing = sum(1 for path in results if not path)
+    print(f"Prepared {len(results) - missing} dataset clips, {missing} failed")
+
+@functools.lru_cache(maxsize=4096)
+def probe_video_format(path):
+    """Read a clip's (codec, width, height) with ffprobe, cached per path"""
+    command = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=codec_name,width,height",
+        "-of", "csv=p=0",
+        path
+    ]
+    output = subprocess.check_output(command).decode().strip()
+    codec, width, height = output.split(",")[:3]
+    return codec, int(width), int(height)
+
+def concat_clips_copy(clip_paths, output_file):
+    """Join clips with the ffmpeg concat demuxer, copying streams without re-encoding"""
+    with tempfile.TemporaryDirectory(dir=TEMP_FOLDER) as tmp:
+        list_path = os.path.join(tmp, "concat.txt")
+        with open(list_path, "w") as f:
+            for path in clip_paths:
+                # Single quotes inside a concat list entry must be escaped
+                escaped = path.replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+
+        command = [
+            "ffmpeg", "-y",
+            "-f", "concat", "-safe", "0",
+            "-i", list_path,
+            "-c", "copy", "-an",
+            output_file
+        ]
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def concat_clips_moviepy(clip_paths, output_file):
+    """Join clips of differing formats by decoding and re-encoding them with MoviePy"""
+    clips = [VideoFileClip(path).without_audio() for path in clip_paths]
+    try:
+        final = concatenate_videoclips(clips, method="compose")
+        final.write_videofile(output_file, audio=False)
+    finally:
+        for clip in clips:
+            clip.close()
+
 def combine_videos(video_paths, session_id):
     """Combine multiple video clips into one"""
-    clips = []
+    clip_paths = []
+    formats = []
     for path in video_paths:
         if os.path.exists(path):
             try:
-                clip = VideoFileClip(path).without_audio()
-                clips.append(clip)
+                formats.append(probe_video_format(path))
+                clip_paths.append(os.path.abspath(path))
             except Exception as e:
                 print(f"Error loading clip {path}: {str(e)}")
     
-    if clips:
+    if clip_paths:
         output_file = os.path.join(STATIC_VIDEOS, f"{session_id}.mp4")
         try:
-            final = concatenate_videoclips(clips, method="compose")
-            final.write_videofile(output_file, audio=False)
+            # Render in a temp dir and move into place when finished, so a
+            # cached video is never seen half-written
+            with tempfile.TemporaryDirectory(dir=TEMP_FOLDER) as tmp:
+                tmp_file = os.path.join(tmp, "combined.mp4")
+
+                # Stream-copy when every clip shares codec and resolution
+                if all(fmt == formats[0] for fmt in formats):
+                    concat_clips_copy(clip_paths, tmp_file)
+                else:
+                    concat_clips_moviepy(clip_paths, tmp_file)
+
+                shutil.move(tmp_file, output_file)
             
             # Return the relative path to be used in templates
             return f"videos/{session_id}.mp4"
@@ -462,14 +935,87 @@ def combine_videos(video_paths, session_id):
     
     return None
 
-# Add the Stanford Parser initialization here
+def get_or_create_isl_video(isl_text):
+    """Return the ISL video for a sentence, reusing one already rendered for the same text"""
+    # The pipeline is deterministic, so the ISL text identifies the video
+    video_id = hashlib.sha256(isl_text.encode()).hexdigest()[:16]
+    output_file = os.path.join(STATIC_VIDEOS, f"{video_id}.mp4")
+
+    try:
+        # Mark as recently used for eviction
+        os.utime(output_file)
+        return f"videos/{video_id}.mp4"
+    except FileNotFoundError:
+        # Not rendered yet, or evicted by another thread or worker
+        pass
+
+    video_path = create_isl_video_enhanced(isl_text, video_id)
+    if video_path:
+        # Eviction is housekeeping, it must never fail a finished render
+        try:
+            evict_old_videos()
+        except OSError as e:
+            print(f"Error evicting cached videos: {str(e)}")
+    return video_path
+
+def evict_old_videos():
+    """Delete the least recently used rendered videos beyond VIDEO_CACHE_SIZE"""
+    videos = []
+    for entry in os.scandir(STATIC_VIDEOS):
+        if not entry.name.endswith(".mp4"):
+            continue
+        try:
+            videos.append((entry.stat().st_mtime, entry.path))
+        except FileNotFoundError:
+            # Already evicted by another thread or worker
+            continue
+
+    if len(videos) <= VIDEO_CACHE_SIZE:
+        return
+
+    videos.sort()
+    for _, path in videos[:len(videos) - VIDEO_CACHE_SIZE]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error evicting cached video {path}: {str(e)}")
+
+download_nltk_data()
+
+# Stanford Parser, set up on first use by get_parser
 sp = None
-try:
-    download_nltk_data()
-    sp = initialize_stanford_parser()
-except Exception as e:
-    print(f"Stanford Parser initialization failed: {str(e)}")
-    print("Will use basic text-to-ISL conversion method")
+sp_initialized = False
+sp_lock = threading.Lock()
+
+def get_parser():
+    """Initialize the Stanford Parser once per process, safe to call from any request"""
+    global sp, sp_initialized
+
+    if not sp_initialized:
+        with sp_lock:
+            if not sp_initialized:
+                try:
+                    sp = initialize_stanford_parser()
+                except Exception as e:
+                    print(f"Stanford Parser initialization failed: {str(e)}")
+                if sp is None:
+                    print("Will use basic text-to-ISL conversion method")
+                sp_initialized = True
+
+    return sp
+
+# Load WordNet now rather than on the first request; gunicorn imports the
+# app in each worker, so this runs once per worker at startup
+warm_nltk_data()
+
+# Reuse clips pre-cut by an earlier run or by: python main.py --warmup
+prime_cut_clip_cache()
+
+# Only one local speech model is loaded per worker
+whisper_model = initialize_whisper_model()
+vosk_model = initialize_vosk_model() if whisper_model is None else None
 
 
 @app.route('/')
@@ -481,14 +1027,11 @@ def process_text():
     data = request.form
     english_text = data.get('text', '')
     
-    # Generate a unique session ID
-    session_id = str(uuid.uuid4())
-    
     # Convert English to ISL using the enhanced method
-    isl_text = text_to_isl_enhanced(english_text, sp)
+    isl_text = text_to_isl_enhanced(english_text, get_parser())
     
-    # Create ISL video with enhanced word processing
-    video_path = create_isl_video_enhanced(isl_text, session_id)
+    # Create ISL video with enhanced word processing (or reuse a cached one)
+    video_path = get_or_create_isl_video(isl_text)
     
     return jsonify({
         'status': 'success',
@@ -514,8 +1057,8 @@ def process_audio():
             # Convert to ISL
             isl_text = text_to_isl_enhanced(english_text)
             
-            # Create ISL video
-            video_path = create_isl_video_enhanced(isl_text, session_id)
+            # Create ISL video (or reuse a cached one)
+            video_path = get_or_create_isl_video(isl_text)
             
             # Clean up temp file
             try:
@@ -537,19 +1080,12 @@ def process_audio():
 
 @app.route('/record_audio', methods=['POST'])
 def record_audio():
-    # Generate a unique session ID
-    session_id = str(uuid.uuid4())
-    
     if 'audio' in request.files:
         audio_file = request.files['audio']
-        temp_path = os.path.join(TEMP_FOLDER, f"{session_id}.webm")
-        audio_file.save(temp_path)
         
-        # Convert webm to wav for speech recognition
-        wav_path = os.path.join(TEMP_FOLDER, f"{session_id}.wav")
-        command = ["ffmpeg", "-i", temp_path, wav_path]
+        # Decode webm straight to PCM in memory for speech recognition
         try:
-            subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            audio_data = decode_audio(audio_file.read())
         except:
             return jsonify({
                 'status': 'error',
@@ -557,21 +1093,14 @@ def record_audio():
             })
             
         # Recognize speech
-        english_text = recognize_speech_from_file(wav_path)
+        english_text = recognize_speech(audio_data)
         
         if english_text:
             # Convert to ISL
             isl_text = text_to_isl_enhanced(english_text)
             
-            # Create ISL video
-            video_path = create_isl_video_enhanced(isl_text, session_id)
-            
-            # Clean up temp files
-            try:
-                os.remove(temp_path)
-                os.remove(wav_path)
-            except:
-                pass
+            # Create ISL video (or reuse a cached one)
+            video_path = get_or_create_isl_video(isl_text)
             
             return jsonify({
                 'status': 'success',
@@ -590,4 +1119,10 @@ def serve_static(filename):
     return send_from_directory('static', filename)
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    if "--warmup" in sys.argv:
+        warmup()
+        sys.exit(0)
+
+    # Development server; in production run under gunicorn:
+    #   gunicorn -c gunicorn_conf.py main:app
+    app.run(debug=bool(os.getenv("FLASK_DEV")), threaded=True)
\ No newline at end of file